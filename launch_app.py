@@ -2,10 +2,15 @@ import subprocess
 import sys
 import os
 
-# Activate virtual environment
-venv_path = os.path.join(os.path.dirname(__file__), "venv", "Scripts", "activate")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Use the venv interpreter directly if it exists, otherwise fall back to
+# whatever Python launched this script. Calling it as an argument list
+# skips the shell, the extra cmd window and the activate-script hop.
+venv_python = os.path.join(BASE_DIR, "venv", "Scripts", "python.exe")
+python = venv_python if os.path.exists(venv_python) else sys.executable
 
 # Run Streamlit app
-app_path = os.path.join(os.path.dirname(__file__), "src", "main_app.py")
+app_path = os.path.join(BASE_DIR, "src", "main_app.py")
 
-subprocess.call(f'start cmd /k "{venv_path} && streamlit run {app_path}"', shell=True)
+subprocess.call([python, "-m", "streamlit", "run", app_path])
@@ -1,21 +1,22 @@
 # config.py
 
 from deep_translator import GoogleTranslator
+import streamlit as st
 
 
+@st.cache_data(ttl=60 * 60 * 24, show_spinner=False)
 def build_supported_languages():
     """
     (Optional utility)
     Ask deep_translator (Google Translate) for ALL supported languages
     and convert them into our internal format.
     Not used right now, but you can keep it for experiments.
+
+    Cached for a day so the network round trip happens once,
+    not on every Streamlit rerun.
     """
     langs = GoogleTranslator().get_supported_languages(as_dict=True)
-    supported = {}
-    for name_lower, code in langs.items():
-        display_name = name_lower.title()
-        supported[display_name] = {"code": code}
-    return supported
+    return {name_lower.title(): {"code": code} for name_lower, code in langs.items()}
 
 
 # NOTE: GOOGLE_TRANSLATE_API_KEY is no longer used. You can delete this line
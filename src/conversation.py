@@ -1,13 +1,19 @@
 #from __future__ import annotations
 
-import tempfile
+import asyncio
+import wave
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from io import BytesIO
+
+import numpy as np
 import streamlit as st
-from fpdf import FPDF
 
 from mic_ui import medical_mic
 from translate import translate_text
-from stt import speech_to_text
-from tts import text_to_speech_file, cleanup_temp_file
+from stt import speech_to_text_cached
+from tts import text_to_speech_bytes, split_sentences, compress_for_web
 from languages import get_all_languages
 
 
@@ -15,6 +21,12 @@ from languages import get_all_languages
 # CONVERSATION HISTORY HELPERS
 # =========================================================
 
+# One conversation turn. A namedtuple is markedly smaller than the dict
+# it replaces and unpacks positionally in the render/PDF loops instead of
+# paying five hash lookups per turn.
+ConvTurn = namedtuple("ConvTurn", "speaker src_lang tgt_lang original translated")
+
+
 def _init_history():
     """Ensure conversation history exists in session_state."""
     if "conv_history" not in st.session_state:
@@ -29,77 +41,127 @@ def _append_message(
     translated_text: str,
 ):
     st.session_state.conv_history.append(
-        {
-            "speaker": speaker,
-            "src_lang": src_lang,
-            "tgt_lang": tgt_lang,
-            "original": original_text,
-            "translated": translated_text,
-        }
+        ConvTurn(speaker, src_lang, tgt_lang, original_text, translated_text)
     )
 
 
+# Literal markup fragments of the turn card, pre-split once at import.
+# Rendering a card is then a single str.join over these plus the five
+# values – no regex placeholder scan like Template.substitute does.
+_CARD = (
+    '<div class="app-card" style="margin-bottom:0.4rem;">'
+    '<div class="pill-label">',
+    '</div><div style="font-size:0.82rem; color:#9ca3af; margin-bottom:0.2rem;">',
+    " → ",
+    '</div><div style="font-size:0.9rem; margin-bottom:0.15rem;"><b>Spoken:</b> ',
+    '</div><div style="font-size:0.9rem;"><b>Translated:</b> ',
+    "</div></div>",
+)
+
+
+def _turn_html(speaker, src_lang, tgt_lang, original, translated) -> str:
+    """HTML card for a single conversation turn (spoken text escaped)."""
+    return "".join(
+        (
+            _CARD[0],
+            speaker,
+            _CARD[1],
+            src_lang,
+            _CARD[2],
+            tgt_lang,
+            _CARD[3],
+            escape(original),
+            _CARD[4],
+            escape(translated),
+            _CARD[5],
+        )
+    )
+
+
+# How many turns get rendered by default; older ones stay behind a toggle
+# so a long session doesn't pay O(full history) DOM cost per rerun.
+_RENDER_WINDOW = 50
+
+
 def _render_history():
-    """Render all previous turns in a nice card layout."""
-    if not st.session_state.conv_history:
+    """Render the recent turns in a nice card layout."""
+    history = st.session_state.conv_history  # one session-state lookup
+    if not history:
         st.info("No conversation yet. Start by recording from Doctor or Patient.")
         return
 
-    for msg in st.session_state.conv_history:
-        speaker = msg["speaker"]
-        original = msg["original"]
-        translated = msg["translated"]
-        src_lang = msg["src_lang"]
-        tgt_lang = msg["tgt_lang"]
+    # For long chats, offer Streamlit's Arrow/dataframe path: virtualized
+    # rendering keeps DOM cost flat no matter how many turns there are.
+    if len(history) > 20 and st.checkbox("Compact table view", key="conv_table_view"):
+        import pandas as pd
 
+        df = pd.DataFrame(history, columns=ConvTurn._fields)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        return
+
+    older = history[:-_RENDER_WINDOW]
+    if older and st.checkbox(f"Show older turns ({len(older)})", key="conv_show_older"):
         st.markdown(
-            f"""
-            <div class="app-card" style="margin-bottom:0.4rem;">
-              <div class="pill-label">{speaker}</div>
-              <div style="font-size:0.82rem; color:#9ca3af; margin-bottom:0.2rem;">
-                {src_lang} → {tgt_lang}
-              </div>
-              <div style="font-size:0.9rem; margin-bottom:0.15rem;">
-                <b>Spoken:</b> {original}
-              </div>
-              <div style="font-size:0.9rem;">
-                <b>Translated:</b> {translated}
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+            "".join(_turn_html(*turn) for turn in older), unsafe_allow_html=True
         )
 
+    # One st.markdown for the recent window: one websocket message and
+    # one DOM delta instead of one per turn. Star-unpacking the turn
+    # tuples feeds the fields positionally – no attribute dispatch in
+    # the loop.
+    html = "".join(_turn_html(*turn) for turn in history[-_RENDER_WINDOW:])
+    st.markdown(html, unsafe_allow_html=True)
 
-def _download_history_pdf_button():
-    """Offer a button to download the full conversation as a PDF."""
-    if not st.session_state.conv_history:
-        return
+
+@st.cache_data(show_spinner=False)
+def _build_history_pdf(entries: tuple) -> bytes:
+    """
+    Build the conversation PDF from a history snapshot.
+
+    Cached on the snapshot tuple, so the PDF is regenerated only when the
+    conversation actually changes – not on every Streamlit rerun.
+    """
+    from fpdf import FPDF  # lazy: only pay the import when a PDF is built
+
+    def _latin1(s: str) -> str:
+        # Classic fpdf's core fonts only handle latin-1; replace anything
+        # else instead of crashing mid-build on e.g. Devanagari output.
+        return s.encode("latin-1", errors="replace").decode("latin-1")
 
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
     pdf.set_font("Arial", "B", 14)
-    pdf.cell(0, 10, "Doctor–Patient Conversation", ln=True)
+    pdf.cell(0, 10, "Doctor-Patient Conversation", ln=True)
 
     pdf.ln(4)
     pdf.set_font("Arial", "", 11)
 
-    for msg in st.session_state.conv_history:
-        speaker = msg["speaker"]
-        src_lang = msg["src_lang"]
-        tgt_lang = msg["tgt_lang"]
-        original = msg["original"]
-        translated = msg["translated"]
-
-        pdf.multi_cell(0, 6, f"{speaker} ({src_lang} → {tgt_lang})")
+    for speaker, src_lang, tgt_lang, original, translated in entries:
+        pdf.multi_cell(0, 6, _latin1(f"{speaker} ({src_lang} -> {tgt_lang})"))
         pdf.set_font("Arial", "I", 11)
-        pdf.multi_cell(0, 5, f"Spoken: {original}")
+        pdf.multi_cell(0, 5, _latin1(f"Spoken: {original}"))
         pdf.set_font("Arial", "", 11)
-        pdf.multi_cell(0, 5, f"Translated: {translated}")
+        pdf.multi_cell(0, 5, _latin1(f"Translated: {translated}"))
         pdf.ln(2)
 
-    pdf_bytes = pdf.output(dest="S").encode("latin-1")
+    out = pdf.output(dest="S")
+    # fpdf2 hands back a bytearray directly; classic fpdf returns a
+    # latin-1 str that needs one encode pass. Avoid the extra full-
+    # document copy whenever the library already gives us bytes.
+    return bytes(out) if isinstance(out, (bytes, bytearray)) else out.encode("latin-1")
+
+
+def _download_history_pdf_button():
+    """Offer a button to download the full conversation as a PDF."""
+    history = st.session_state.conv_history
+    if not history:
+        return
+
+    # ConvTurn is a tuple, so the snapshot (and cache key) is just the
+    # history itself frozen – no per-field repacking.
+    entries = tuple(history)
+    pdf_bytes = _build_history_pdf(entries)
 
     st.download_button(
         label="📄 Download conversation as PDF",
@@ -110,10 +172,171 @@ def _download_history_pdf_button():
     )
 
 
+# =========================================================
+# CACHED TRANSLATION
+# =========================================================
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _translate_cached(text: str, src: str, tgt: str) -> str:
+    """
+    Memoized translate_text.
+
+    Clinical back-and-forth repeats short phrases constantly ("yes",
+    "where does it hurt?"), so a hit here skips a whole HTTP round trip.
+    """
+    return translate_text(text, src, tgt)
+
+
+@st.cache_data(max_entries=256, show_spinner=False, persist="disk")
+def _tts_call_cached(text: str, lang: str) -> bytes:
+    """
+    Memoized per-sentence TTS.
+
+    Stock sentences ("Take one tablet after food.") recur across turns
+    AND across sessions, so entries persist to Streamlit's disk cache –
+    a restarted app still answers common phrases without touching the
+    gTTS API. max_entries bounds the in-memory tier; the disk tier is
+    flushed by the sidebar clear button like everything else. Failures
+    raise past the cache so a transient gTTS hiccup is never persisted
+    as permanent silence for that sentence.
+    """
+    audio = text_to_speech_bytes(text, lang)
+    if not audio:
+        raise RuntimeError("TTS produced no audio")
+    return audio
+
+
+def _tts_cached(text: str, lang: str) -> bytes | None:
+    """Catching wrapper over _tts_call_cached – returns None on failure
+    so the playback loop can simply skip the sentence."""
+    try:
+        return _tts_call_cached(text, lang)
+    except Exception:
+        # Already logged inside text_to_speech_bytes.
+        return None
+
+
+# =========================================================
+# AUDIO PRE-PROCESSING
+# =========================================================
+
+def _preprocess_wav(audio_bytes: bytes) -> bytes:
+    """
+    Trim edge silence and peak-normalize a mono 16-bit WAV recording in
+    one decode/encode pass.
+
+    Silence trimming is energy-based VAD over 30 ms frames: anything
+    quieter than a small fraction of the peak frame energy counts as
+    silence, and STT cost grows with audio duration, so dropping dead
+    air is free recognition time. Quiet recordings then get scaled so
+    the peak sits near full scale, which helps accuracy.
+
+    Fusing both passes means the WAV container is parsed and rebuilt
+    once instead of twice per turn. Everything in between is vectorized
+    numpy running at memory bandwidth – there is no per-sample Python
+    loop left to JIT. Returns the original bytes untouched if the audio
+    can't be parsed or contains no clear speech.
+    """
+    try:
+        with wave.open(BytesIO(audio_bytes)) as wf:
+            params = wf.getparams()
+            frames = wf.readframes(wf.getnframes())
+
+        if params.sampwidth != 2 or params.nchannels != 1:
+            return audio_bytes
+
+        samples = np.frombuffer(frames, dtype=np.int16)
+
+        # --- trim edge silence ---
+        frame_len = int(params.framerate * 0.03)
+        n_frames = len(samples) // frame_len if frame_len else 0
+        if n_frames >= 2:
+            energy = (
+                np.abs(samples[: n_frames * frame_len].astype(np.float32))
+                .reshape(n_frames, frame_len)
+                .mean(axis=1)
+            )
+            voiced = np.nonzero(energy > max(energy.max() * 0.02, 1.0))[0]
+            if voiced.size == 0:
+                return audio_bytes
+            start = voiced[0] * frame_len
+            end = min(len(samples), (voiced[-1] + 1) * frame_len)
+            samples = samples[start:end]
+
+        # --- peak-normalize ---
+        peak = int(np.max(np.abs(samples))) if samples.size else 0
+        if peak == 0:
+            return audio_bytes
+        if peak < 26000:  # leave already-loud recordings untouched
+            samples = np.clip(
+                samples.astype(np.float32) * (32000.0 / peak), -32768, 32767
+            ).astype(np.int16)
+
+        buf = BytesIO()
+        with wave.open(buf, "wb") as out:
+            out.setnchannels(params.nchannels)
+            out.setsampwidth(params.sampwidth)
+            out.setframerate(params.framerate)
+            out.writeframes(samples.tobytes())
+        return buf.getvalue()
+    except Exception:
+        return audio_bytes
+
+
 # =========================================================
 # CORE PIPELINE FOR ONE TURN
 # =========================================================
 
+async def _run_turn_pipeline(audio_bytes: bytes, src_lang: str, tgt_lang: str):
+    """
+    Run STT -> translation off the Streamlit script thread.
+
+    Both stages are blocking network calls, so they are pushed to worker
+    threads via asyncio.to_thread; they stay ordered because translation
+    consumes the recognized text. Both are cached on their inputs, so a
+    replayed clip (rerun, repeat click) skips the network entirely. TTS
+    is handled by the caller, which plays sentence chunks as they finish
+    synthesizing.
+    """
+    original_text = await asyncio.to_thread(
+        speech_to_text_cached, audio_bytes, src_lang
+    )
+    if not original_text or not original_text.strip():
+        return "", ""
+
+    translated_text = await asyncio.to_thread(
+        _translate_cached, original_text, src_lang, tgt_lang
+    )
+
+    return original_text, translated_text
+
+
+def _play_tts_chunks(translated_text: str, tgt_lang: str):
+    """
+    Synthesize the reply sentence-by-sentence and play each chunk the
+    moment it is ready.
+
+    All sentences are submitted to a small thread pool up front, then the
+    futures are consumed in sentence order. Streamlit flushes elements as
+    the script emits them, so the listener hears the first sentence after
+    roughly one sentence of synthesis time while the rest finish in the
+    background.
+    """
+    sentences = split_sentences(translated_text)
+    if not sentences:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(4, len(sentences))) as pool:
+        futures = [
+            pool.submit(_tts_cached, sent, tgt_lang) for sent in sentences
+        ]
+        for fut in futures:
+            audio = fut.result()
+            if audio:
+                audio, mime = compress_for_web(audio)
+                st.audio(audio, format=mime)
+
+
 def _process_turn(role: str, audio_data, src_lang: str, tgt_lang: str):
     """
     Full pipeline for one side:
@@ -145,48 +368,39 @@ def _process_turn(role: str, audio_data, src_lang: str, tgt_lang: str):
             st.error("Internal error: could not convert recorded audio.")
             return
 
-    # --- 2) Save audio to a temp WAV file ---
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-    tmp.write(audio_bytes)
-    tmp.flush()
-    tmp.close()
-    wav_path = tmp.name
+    # Drop leading/trailing silence and normalize level before STT
+    audio_bytes = _preprocess_wav(audio_bytes)
 
     try:
-        # --- 3) Speech-to-text ---
-        with st.spinner(f"Recognizing {role} speech..."):
-            # IMPORTANT: no keyword like source_language_name= here
-            original_text = speech_to_text(wav_path, src_lang)
-
-        if not original_text or not original_text.strip():
+        # --- 3) STT -> translation -> TTS under one spinner ---
+        with st.spinner(f"Processing {role.lower()} speech..."):
+            loop = asyncio.new_event_loop()
+            try:
+                original_text, translated_text = loop.run_until_complete(
+                    _run_turn_pipeline(audio_bytes, src_lang, tgt_lang)
+                )
+            finally:
+                loop.close()
+
+        if not original_text:
             st.error(f"Could not recognize {role.lower()} speech. Please try again.")
             return
 
-        # --- 4) Translate + TTS ---
-        with st.spinner("Translating and generating reply audio..."):
-            translated_text = translate_text(original_text, src_lang, tgt_lang)
-
-            # Show text in UI
-            st.markdown(
-                f"**{role} said:** {original_text}<br/>"
-                f"**Translated:** {translated_text}",
-                unsafe_allow_html=True,
-            )
+        # --- 4) Show text in UI ---
+        # Native chat widgets diff through Streamlit's component tree
+        # instead of re-parsing inline HTML on every rerun.
+        with st.chat_message("assistant" if role == "Doctor" else "user"):
+            st.write(f"**{role} said:** {original_text}")
+            st.write(f"**Translated:** {translated_text}")
 
-            # Add to history
-            _append_message(role, src_lang, tgt_lang, original_text, translated_text)
+        # Add to history
+        _append_message(role, src_lang, tgt_lang, original_text, translated_text)
 
-            # TTS playback for translated text
-            if translated_text and translated_text.strip():
-                tts_path = text_to_speech_file(translated_text, tgt_lang)
-                if tts_path:
-                    with open(tts_path, "rb") as f:
-                        audio_out = f.read()
-                    st.audio(audio_out, format="audio/mp3")
-                    cleanup_temp_file(tts_path)
-    finally:
-        # always clean up temp wav file
-        cleanup_temp_file(wav_path)
+        # TTS playback: first sentence plays while the rest synthesize
+        if translated_text and translated_text.strip():
+            _play_tts_chunks(translated_text, tgt_lang)
+    except Exception as e:
+        st.error(f"Error while processing {role.lower()} turn: {e}")
 
 
 # =========================================================
@@ -230,7 +444,11 @@ def show_conversation(theme_choice: str, languages: list[str] | None = None):
 
     st.markdown("---")
 
-    # Microphones
+    # Microphones. These must be created sequentially on the script
+    # thread: Streamlit widgets register against the script-run context
+    # and element order, so pushing medical_mic calls into worker threads
+    # is not safe. The widgets are cheap server-side anyway – the browser
+    # initializes both recorders in parallel on its own.
     col_mic_doc, col_mic_pat = st.columns(2)
 
     with col_mic_doc:
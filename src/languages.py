@@ -1,11 +1,44 @@
 # languages.py
 
+from types import MappingProxyType
+
 from config import SUPPORTED_LANGUAGES
 
 
-def get_all_languages() -> list[str]:
-    """Return list of language names for dropdowns."""
-    return list(SUPPORTED_LANGUAGES.keys())
+# EasyOCR codes, built once at import. Read-only so nothing can mutate it,
+# and no per-call dict literal to reallocate in code_for_easyocr.
+_EASYOCR_CODES = MappingProxyType(
+    {
+        "English": "en",
+        "Hindi": "hi",
+        "Tamil": "ta",
+        "Telugu": "te",
+        "Kannada": "kn",
+        "Malayalam": "ml",
+        "Marathi": "mr",
+        "Bengali": "bn",
+        "Gujarati": "gu",
+        "Urdu": "ur",
+        "French": "fr",
+        "Spanish": "es",
+        "German": "de",
+        "Chinese (Simplified)": "ch_sim",
+        "Chinese (Traditional)": "ch_tra",
+        "Japanese": "ja",
+        "Korean": "ko",
+        "Thai": "th",
+    }
+)
+
+
+# SUPPORTED_LANGUAGES is immutable config, so the dropdown list is
+# computed once at import instead of reallocated per rerun.
+_ALL_LANGS: tuple[str, ...] = tuple(SUPPORTED_LANGUAGES.keys())
+
+
+def get_all_languages() -> tuple[str, ...]:
+    """Return all language names for dropdowns (cached tuple)."""
+    return _ALL_LANGS
 
 
 def lang_code_for_translation(lang_name: str) -> str:
@@ -32,24 +65,4 @@ def code_for_easyocr(lang_name: str) -> str:
     Map UI language name to EasyOCR code for image OCR.
     Only some languages are supported by EasyOCR; others fall back to 'en'.
     """
-    mapping = {
-        "English": "en",
-        "Hindi": "hi",
-        "Tamil": "ta",
-        "Telugu": "te",
-        "Kannada": "kn",
-        "Malayalam": "ml",
-        "Marathi": "mr",
-        "Bengali": "bn",
-        "Gujarati": "gu",
-        "Urdu": "ur",
-        "French": "fr",
-        "Spanish": "es",
-        "German": "de",
-        "Chinese (Simplified)": "ch_sim",
-        "Chinese (Traditional)": "ch_tra",
-        "Japanese": "ja",
-        "Korean": "ko",
-        "Thai": "th",
-    }
-    return mapping.get(lang_name, "en")
+    return _EASYOCR_CODES.get(lang_name, "en")
@@ -2,42 +2,73 @@
 
 from __future__ import annotations
 
+import hashlib
+from string import Template
+
 import streamlit as st
 from audio_recorder_streamlit import audio_recorder
 
 
-def _status_box(text: str, mode: str = "info") -> None:
-    """Show a clear status message with icons."""
-    if mode == "ready":
-        bg = "#e0f2fe"
-        border = "#2563eb"
-        emoji = "▶"   # start icon
-    elif mode == "saved":
-        bg = "#e8f5e9"
-        border = "#22c55e"
-        emoji = "⏹"  # stop icon / done
-    else:
-        bg = "#fef9c3"
-        border = "#f59e0b"
-        emoji = "🎙️"
+# Instructions card markup, parsed once at import. Only the title varies
+# between the mic widgets, so each call just fills one placeholder.
+_MIC_CARD_TEMPLATE = Template(
+    """
+        <div style="
+            border-radius:18px;
+            padding:1rem 1.2rem;
+            background:rgba(255,255,255,0.96);
+            box-shadow:0 8px 20px rgba(15,23,42,0.10);
+            border:1px solid rgba(148,163,184,0.45);
+            margin-bottom:0.5rem;
+        ">
+            <div style="font-weight:700; font-size:1.05rem; margin-bottom:0.2rem;">
+                ${title}
+            </div>
+            <div style="font-size:0.85rem; color:#64748b;">
+                <b>How to use:</b><br/>
+                ▶ Click the mic icon once to <b>start</b> recording.<br/>
+                ⏹ Click the mic icon again to <b>stop</b> and save.<br/>
+                The last saved recording will be used for translation.
+            </div>
+        </div>
+    """
+)
 
-    st.markdown(
-        f"""
+
+# Status box markup, parsed once at import like the card above; per call
+# only the colors/icon/text placeholders are filled in.
+_STATUS_BOX_TEMPLATE = Template(
+    """
         <div style="
             margin-top:0.6rem;
             padding:0.45rem 0.8rem;
             border-radius:10px;
-            background:{bg};
-            border:1px solid {border};
+            background:${bg};
+            border:1px solid ${border};
             font-size:0.9rem;
             display:flex;
             align-items:center;
             gap:0.5rem;
         ">
-            <span style="font-size:1.1rem;">{emoji}</span>
-            <span>{text}</span>
+            <span style="font-size:1.1rem;">${emoji}</span>
+            <span>${text}</span>
         </div>
-        """,
+    """
+)
+
+# (background, border, icon) per status mode
+_STATUS_STYLES = {
+    "ready": ("#e0f2fe", "#2563eb", "▶"),   # start icon
+    "saved": ("#e8f5e9", "#22c55e", "⏹"),  # stop icon / done
+    "info": ("#fef9c3", "#f59e0b", "🎙️"),
+}
+
+
+def _status_box(text: str, mode: str = "info") -> None:
+    """Show a clear status message with icons."""
+    bg, border, emoji = _STATUS_STYLES.get(mode, _STATUS_STYLES["info"])
+    st.markdown(
+        _STATUS_BOX_TEMPLATE.substitute(bg=bg, border=border, emoji=emoji, text=text),
         unsafe_allow_html=True,
     )
 
@@ -56,35 +87,20 @@ def medical_mic(title: str, key: str) -> bytes | None:
     """
 
     last_audio_key = f"{key}_last_audio"
+    audio_hash_key = f"{key}_last_audio_hash"
 
     if last_audio_key not in st.session_state:
         st.session_state[last_audio_key] = None
 
-    st.markdown(
-        f"""
-        <div style="
-            border-radius:18px;
-            padding:1rem 1.2rem;
-            background:rgba(255,255,255,0.96);
-            box-shadow:0 8px 20px rgba(15,23,42,0.10);
-            border:1px solid rgba(148,163,184,0.45);
-            margin-bottom:0.5rem;
-        ">
-            <div style="font-weight:700; font-size:1.05rem; margin-bottom:0.2rem;">
-                {title}
-            </div>
-            <div style="font-size:0.85rem; color:#64748b;">
-                <b>How to use:</b><br/>
-                ▶ Click the mic icon once to <b>start</b> recording.<br/>
-                ⏹ Click the mic icon again to <b>stop</b> and save.<br/>
-                The last saved recording will be used for translation.
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_MIC_CARD_TEMPLATE.substitute(title=title), unsafe_allow_html=True)
 
-    # Main mic widget (this is the real start/stop control)
+    # Main mic widget (this is the real start/stop control).
+    # The component encodes the clip to WAV in the browser and hands the
+    # finished bytes over the websocket – there is no server-side access
+    # to the raw PCM track while recording, so the capture path can't be
+    # restructured around a pre-allocated ring buffer. 16 kHz mono keeps
+    # the payload minimal, and downstream stages read the bytes without
+    # copying (np.frombuffer views, BytesIO for STT).
     audio_bytes = audio_recorder(
         text="Click mic to START / STOP recording",
         recording_color="#ef4444",
@@ -95,9 +111,14 @@ def medical_mic(title: str, key: str) -> bytes | None:
         key=key,
     )
 
-    # If user just recorded new audio, store it
+    # If user just recorded NEW audio, store it. The widget hands back the
+    # same bytes on every rerun, so compare a short digest first and only
+    # touch session_state when the recording actually changed.
     if audio_bytes is not None:
-        st.session_state[last_audio_key] = audio_bytes
+        audio_hash = hashlib.blake2b(audio_bytes, digest_size=8).hexdigest()
+        if st.session_state.get(audio_hash_key) != audio_hash:
+            st.session_state[last_audio_key] = audio_bytes
+            st.session_state[audio_hash_key] = audio_hash
 
     # Decide what to show based on whether we have audio
     if st.session_state[last_audio_key] is None:
@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+import threading
+from functools import lru_cache
+from typing import Literal, Tuple
 
 import numpy as np
 import cv2
 from PIL import Image
 import pytesseract
 
+# Optional in-process binding: pytesseract forks a tesseract binary per
+# call (temp PNG write, stdout read, traineddata reload – tens to
+# hundreds of ms each time). tesserocr keeps one persistent API object
+# per language instead, so recognition stays in-process. The subprocess
+# path below remains the fallback when it is not installed.
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
+# PyTessBaseAPI is not thread-safe; serialize SetImage/GetUTF8Text.
+_api_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _get_tess_api(lang: str):
+    """One persistent Tesseract API per language (traineddata loads once)."""
+    return PyTessBaseAPI(lang=lang, psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+
 
 # Map UI language names to Tesseract language codes
 LANG_MAP = {
@@ -27,7 +48,9 @@ LANG_MAP = {
 }
 
 
-def _preprocess_for_tesseract(pil_img: Image.Image) -> np.ndarray:
+def _preprocess_for_tesseract(
+    pil_img: Image.Image, denoise_level: Literal["fast", "quality"] = "fast"
+) -> np.ndarray:
     """
     Basic preprocessing for Tesseract:
     - convert to grayscale
@@ -35,17 +58,37 @@ def _preprocess_for_tesseract(pil_img: Image.Image) -> np.ndarray:
     - denoise
     - adaptive threshold
     Returns a NumPy array that can be shown with st.image().
-    """
-    img = np.array(pil_img.convert("RGB"))
 
-    # grayscale
-    gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
+    denoise_level "fast" uses an edge-preserving bilateral filter;
+    "quality" opts back into non-local means for genuinely noisy
+    handwriting, at several hundred times the per-pixel cost.
+    """
+    # Grayscale with as few full-image passes as possible: np.asarray
+    # wraps PIL's buffer without the copy np.array makes, grayscale
+    # sources skip cvtColor entirely, and only exotic modes (palette,
+    # alpha, CMYK) pay for a PIL convert.
+    if pil_img.mode == "L":
+        gray = np.asarray(pil_img)
+    else:
+        if pil_img.mode != "RGB":
+            pil_img = pil_img.convert("RGB")
+        gray = cv2.cvtColor(np.asarray(pil_img), cv2.COLOR_RGB2GRAY)
 
     # upscale slightly to help OCR
     gray = cv2.resize(gray, None, fx=1.5, fy=1.5, interpolation=cv2.INTER_LINEAR)
 
-    # denoise
-    gray = cv2.fastNlMeansDenoising(gray, None, 25, 7, 21)
+    # denoise – the bilateral filter smooths grain while keeping stroke
+    # edges crisp, at <50 ops per pixel. The old default, non-local
+    # means at 21^2 search x 7^2 template (~9k ops per pixel), dominated
+    # this function by seconds on phone photos; it survives behind
+    # denoise_level="quality" for noisy handwriting only.
+    # (cv2.adaptiveThreshold itself already runs as a native
+    # integral-image pass, so there is nothing left here worth
+    # hand-JITting.)
+    if denoise_level == "quality":
+        gray = cv2.fastNlMeansDenoising(gray, None, 25, 7, 21)
+    else:
+        gray = cv2.bilateralFilter(gray, 5, 40, 40)
 
     # adaptive thresholding
     thr = cv2.adaptiveThreshold(
@@ -60,7 +103,11 @@ def _preprocess_for_tesseract(pil_img: Image.Image) -> np.ndarray:
     return thr
 
 
-def ocr_image(pil_img: Image.Image, lang_name: str) -> Tuple[str, np.ndarray]:
+def ocr_image(
+    pil_img: Image.Image,
+    lang_name: str,
+    denoise_level: Literal["fast", "quality"] = "fast",
+) -> Tuple[str, np.ndarray]:
     """
     Main OCR function used by main_app.show_image_tab.
 
@@ -72,10 +119,20 @@ def ocr_image(pil_img: Image.Image, lang_name: str) -> Tuple[str, np.ndarray]:
         text: extracted text (string)
         processed: processed image (NumPy array) for display
     """
-    processed = _preprocess_for_tesseract(pil_img)
+    processed = _preprocess_for_tesseract(pil_img, denoise_level=denoise_level)
 
     tess_lang = LANG_MAP.get(lang_name, "eng")
 
+    if PyTessBaseAPI is not None:
+        try:
+            api = _get_tess_api(tess_lang)
+            with _api_lock:
+                api.SetImage(Image.fromarray(processed))
+                text = api.GetUTF8Text()
+            return text.strip(), processed
+        except Exception as e:
+            print("tesserocr failed, falling back to pytesseract:", e)
+
     # psm 6 = assume a block of text
     config = "--oem 3 --psm 6"
 
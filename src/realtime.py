@@ -2,7 +2,6 @@
 
 import streamlit as st
 from stt import speech_to_text
-from tts import text_to_speech_file
 from translate import translate_text
 from themes import apply_theme
 
@@ -2,12 +2,104 @@
 
 from __future__ import annotations  # MUST be the very first line
 
+import logging
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+import numpy as np
 import speech_recognition as sr
 import streamlit as st
 
 from languages import lang_code_for_translation
 
+# Recognition runs on worker threads (iter_transcript_segments' pool,
+# the chat tab's asyncio.to_thread) where st.error is a no-op, so
+# failures are logged here and the calling tabs warn the user when no
+# transcript comes back – same split as tts.py.
+logger = logging.getLogger(__name__)
+
+# Optional local backend: faster-whisper (CTranslate2) lets recognition
+# run offline. Quantized to int8 it is ~2x faster and ~4x smaller on CPU
+# than float32 with negligible accuracy loss. The Google Web Speech path
+# below stays the fallback when it is not installed.
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+
+@st.cache_resource(show_spinner=False)
+def _get_local_whisper():
+    """Load the int8-quantized local Whisper model once per process."""
+    return WhisperModel("base", device="cpu", compute_type="int8")
+
+
+def _speech_to_text_local(audio_source, stt_lang: str) -> str:
+    """
+    Transcribe with the local faster-whisper model.
+
+    Greedy decoding (beam_size=1) is accurate enough for short clinical
+    clips and decodes markedly faster than the default beam of 5; the
+    VAD filter skips silence between utterances so the model never
+    decodes empty audio.
+    """
+    model = _get_local_whisper()
+    segments, _info = model.transcribe(
+        audio_source,
+        language=stt_lang.split("-")[0],
+        beam_size=1,
+        vad_filter=True,
+    )
+    return " ".join(seg.text.strip() for seg in segments).strip()
+
+
+def is_probably_silent(wav_bytes: bytes, rms_threshold: float = 200.0) -> bool:
+    """
+    Cheap energy gate: True if a 16-bit PCM WAV clip is almost certainly
+    silence (RMS below ~0.6% of full scale).
+
+    One vectorized pass over the samples costs microseconds, versus the
+    full network round trip a recognizer would spend before returning
+    nothing. Returns False whenever unsure, so unusual clips still reach
+    the recognizer.
+    """
+    try:
+        with wave.open(BytesIO(wav_bytes)) as wf:
+            if wf.getsampwidth() != 2:
+                return False
+            frames = wf.readframes(wf.getnframes())
+
+        samples = np.frombuffer(frames, dtype=np.int16)
+        if samples.size == 0:
+            return True
+
+        rms = float(np.sqrt(np.mean(np.square(samples.astype(np.float32)))))
+        return rms < rms_threshold
+    except Exception:
+        return False
 
+
+@st.cache_resource(show_spinner=False)
+def get_recognizer() -> sr.Recognizer:
+    """
+    Return a shared Recognizer instance.
+
+    Streamlit reruns the whole script on every button click, so building
+    a fresh Recognizer per call would repeat setup work on every turn.
+    The energy threshold is fixed up front: inputs arrive as finished
+    clips from the browser recorder or uploads, so there is no live
+    stream to run adjust_for_ambient_noise against, and a dynamic
+    threshold would just drift between requests.
+    """
+    recognizer = sr.Recognizer()
+    recognizer.energy_threshold = 300
+    recognizer.dynamic_energy_threshold = False
+    return recognizer
+
+
+@lru_cache(maxsize=None)
 def _stt_code_for_language(lang_name: str) -> str:
     """
     Map our language name to a code usable by Google's STT.
@@ -28,14 +120,51 @@ def _stt_code_for_language(lang_name: str) -> str:
     return code
 
 
-def speech_to_text(audio_path: str, language_name: str) -> str:
+def _recognize(audio_source, language_name: str) -> str:
+    """
+    Recognition core – raises on backend failure.
+
+    "" means the clip was genuinely unintelligible, which is a stable
+    result and safe to cache; API/network failures propagate so the
+    cached tier below never memoizes a transient outage.
+    """
+    stt_lang = _stt_code_for_language(language_name)
+
+    # Prefer the local quantized model when available (offline, no API
+    # quota); fall back to Google Web Speech on any failure.
+    if WhisperModel is not None:
+        try:
+            return _speech_to_text_local(audio_source, stt_lang)
+        except Exception as e:
+            logger.warning("Local whisper failed, falling back to Google: %s", e)
+            if hasattr(audio_source, "seek"):
+                audio_source.seek(0)
+
+    recognizer = get_recognizer()
+
+    with sr.AudioFile(audio_source) as source:
+        audio_data = recognizer.record(source)
+
+    try:
+        # Needs internet
+        return recognizer.recognize_google(audio_data, language=stt_lang) or ""
+    except sr.UnknownValueError:
+        # Speech was not understood
+        return ""
+
+
+def speech_to_text(audio_source, language_name: str) -> str:
     """
-    Convert speech audio file to text.
+    Convert speech audio to text.
 
     Parameters
     ----------
-    audio_path : str
-        Path to a WAV audio file.
+    audio_source : str | file-like
+        Path to a WAV audio file, or an in-memory file-like object
+        (e.g. io.BytesIO) holding the WAV bytes. sr.AudioFile accepts
+        both, so callers should prefer the buffer form: the upload's
+        bytes then feed the recognizer directly instead of being
+        written to a temp file and read back from disk.
     language_name : str
         Human-readable language name (e.g. "English", "Hindi").
 
@@ -44,25 +173,92 @@ def speech_to_text(audio_path: str, language_name: str) -> str:
     str
         Recognized text, or "" if recognition failed.
     """
-    recognizer = sr.Recognizer()
-    stt_lang = _stt_code_for_language(language_name)
-
-    # Optional debug:
-    # st.write(f"Using STT language code: {stt_lang}")
-
     try:
-        with sr.AudioFile(audio_path) as source:
-            audio_data = recognizer.record(source)
-
-        # Needs internet
-        text = recognizer.recognize_google(audio_data, language=stt_lang)
-        return text or ""
-    except sr.UnknownValueError:
-        # Speech was not understood
-        return ""
+        return _recognize(audio_source, language_name)
     except sr.RequestError as e:
-        st.error(f"Speech recognition error (API): {e}")
+        logger.error("Speech recognition error (API): %s", e)
+        return ""
+    except Exception as e:
+        logger.error("Speech recognition error: %s", e)
         return ""
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _recognize_bytes_cached(audio_bytes: bytes, language_name: str) -> str:
+    """Cached recognition keyed on raw clip bytes – failures raise past
+    the cache, so only real transcripts (and genuine silence) stick."""
+    return _recognize(BytesIO(audio_bytes), language_name)
+
+
+def speech_to_text_cached(audio_bytes: bytes, language_name: str) -> str:
+    """
+    speech_to_text keyed on the raw clip bytes.
+
+    Recognition is a pure function of (audio, language), but Streamlit
+    re-executes call sites on every widget interaction; a hit here turns
+    a repeat recognition of the same clip into a hash lookup. Entries
+    are short mic clips, so 64 of them stay cheap, and a failed
+    recognition is never cached – a retry click hits the backend again.
+    """
+    try:
+        return _recognize_bytes_cached(audio_bytes, language_name)
     except Exception as e:
-        st.error(f"Speech recognition error: {e}")
+        logger.error("Speech recognition error: %s", e)
         return ""
+
+
+# Slice length for chunked recognition of long clips. Shorter slices
+# surface the first transcript sooner; longer ones give the recognizer
+# more context per request.
+_CHUNK_SECONDS = 10.0
+
+
+def iter_transcript_segments(
+    wav_bytes: bytes, language_name: str, chunk_seconds: float = _CHUNK_SECONDS
+):
+    """
+    Yield transcript text per ~chunk_seconds slice of a WAV clip, in order.
+
+    Long clips are cut at frame boundaries and the slices recognized
+    concurrently, so a caller can start translating slice one while
+    slices two onward are still at the recognizer – end-to-end latency
+    approaches the slowest stage instead of the sum of stages. The cut
+    is blind (a word straddling a boundary may be garbled), which is an
+    acceptable trade for interactive use. Clips shorter than ~1.5 slices,
+    and anything the wave module cannot parse, go through a single
+    speech_to_text call instead.
+    """
+    try:
+        with wave.open(BytesIO(wav_bytes)) as wf:
+            params = wf.getparams()
+            frames_per_chunk = int(wf.getframerate() * chunk_seconds)
+            if wf.getnframes() <= int(frames_per_chunk * 1.5):
+                raise ValueError("clip too short to split")
+
+            chunks = []
+            while True:
+                frames = wf.readframes(frames_per_chunk)
+                if not frames:
+                    break
+                buf = BytesIO()
+                with wave.open(buf, "wb") as out:
+                    out.setnchannels(params.nchannels)
+                    out.setsampwidth(params.sampwidth)
+                    out.setframerate(params.framerate)
+                    out.writeframes(frames)
+                chunks.append(buf.getvalue())
+    except Exception:
+        text = speech_to_text(BytesIO(wav_bytes), language_name)
+        if text and text.strip():
+            yield text.strip()
+        return
+
+    with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+        futures = [
+            pool.submit(speech_to_text, BytesIO(chunk), language_name)
+            for chunk in chunks
+        ]
+        for fut in futures:
+            text = (fut.result() or "").strip()
+            if text:
+                yield text
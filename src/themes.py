@@ -3,21 +3,21 @@
 import streamlit as st
 
 
-def apply_theme(mode: str = "Light") -> None:
-    """
-    Inject global CSS for light/dark premium theme.
-    `mode` is "Light" or "Dark".
+def _build_css(is_dark: bool) -> str:
     """
-    is_dark = (mode.lower() == "dark")
+    Build the full CSS block for one theme mode.
 
+    Called exactly twice, at import – the results live in _LIGHT_CSS /
+    _DARK_CSS below, so apply_theme only has to pick one. (Constants
+    beat st.cache_data here: no hash of the argument per rerun.)
+    """
     bg = "#020617" if is_dark else "#f3f4f6"
     card_bg = "rgba(15,23,42,0.92)" if is_dark else "rgba(255,255,255,0.96)"
     card_border = "rgba(148,163,184,0.65)" if is_dark else "rgba(148,163,184,0.55)"
     text_main = "#e5e7eb" if is_dark else "#0f172a"
     text_secondary = "#9ca3af" if is_dark else "#6b7280"
 
-    st.markdown(
-        f"""
+    return f"""
         <style>
         /* Global background */
         .stApp {{
@@ -92,6 +92,21 @@ def apply_theme(mode: str = "Light") -> None:
             padding-bottom:0.4rem;
         }}
         </style>
-        """,
+        """
+
+
+# Both theme variants fully rendered at import; per-rerun work is one
+# dict-free string pick plus the st.markdown emit.
+_LIGHT_CSS = _build_css(False)
+_DARK_CSS = _build_css(True)
+
+
+def apply_theme(mode: str = "Light") -> None:
+    """
+    Inject global CSS for light/dark premium theme.
+    `mode` is "Light" or "Dark".
+    """
+    st.markdown(
+        _DARK_CSS if mode.lower() == "dark" else _LIGHT_CSS,
         unsafe_allow_html=True,
     )
@@ -1,32 +1,75 @@
 # translate.py  – use deep_translator only
 
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
 from deep_translator import GoogleTranslator
 from languages import lang_code_for_translation
 
+# deep_translator fires every request through the module-level
+# requests.get, so each translation pays a fresh TCP + TLS handshake.
+# A pooled Session swapped into its module gives keep-alive reuse
+# across calls and enough connections for the concurrent bucket
+# dispatch below. Session.get matches the requests.get signature, and
+# requests.get is the only attribute the module touches; the guard
+# leaves stock behavior in place if an upstream refactor changes that.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+try:
+    from deep_translator import google as _dt_google
+
+    if getattr(_dt_google, "requests", None) is requests:
+        _dt_google.requests = _SESSION
+except Exception:
+    pass
+
+
+@lru_cache(maxsize=64)
+def _get_translator(src_code: str, tgt_code: str) -> GoogleTranslator:
+    """
+    One GoogleTranslator client per (source, target) pair.
+
+    The client owns a requests session, so reusing it keeps the HTTP
+    connection alive across calls instead of rebuilding it per phrase.
+
+    Translation runs on Google's servers – there is no local model here
+    to quantize or distill, so per-sentence latency is dominated by the
+    network round trip. The levers that apply on this side are the
+    connection reuse above and the request batching in translate_batch /
+    translate_many below.
+    """
+    return GoogleTranslator(source=src_code, target=tgt_code)
+
 
+# Special-case spellings deep_translator expects, keyed lowercase.
+# (It also accepts full names like 'chinese (simplified)'.)
+_NORMALIZE = {
+    "zh-cn": "zh-CN",
+    "zh-tw": "zh-TW",
+    "chinese (simplified)": "chinese (simplified)",
+    "simplified chinese": "chinese (simplified)",
+    "chinese (traditional)": "chinese (traditional)",
+    "traditional chinese": "chinese (traditional)",
+}
+
+
+@lru_cache(maxsize=256)
 def _normalize_code(code: str | None) -> str:
     """
     Normalize language codes so deep_translator accepts them.
-    Handles Chinese variants and basic cleanup.
+
+    One dict lookup instead of a branch cascade, memoized so hot codes
+    skip even the strip/lower allocations – this runs ahead of every
+    network request.
     """
     if not code:
         return ""
 
     code = code.strip()
-
-    low = code.lower()
-    if low == "zh-cn":
-        return "zh-CN"
-    if low == "zh-tw":
-        return "zh-TW"
-
-    # deep_translator also accepts full names like 'chinese (simplified)'
-    if low in ("chinese (simplified)", "simplified chinese"):
-        return "chinese (simplified)"
-    if low in ("chinese (traditional)", "traditional chinese"):
-        return "chinese (traditional)"
-
-    return code
+    return _NORMALIZE.get(code.lower(), code)
 
 
 def translate_text(text: str, src_lang_name: str, tgt_lang_name: str) -> str:
@@ -43,6 +86,11 @@ def translate_text(text: str, src_lang_name: str, tgt_lang_name: str) -> str:
     if not text:
         return ""
 
+    # Pure numbers, punctuation and URLs come back from the API
+    # unchanged but still bill a full round trip; skip them outright.
+    if not any(c.isalpha() for c in text):
+        return text
+
     src_code = lang_code_for_translation(src_lang_name)
     tgt_code = lang_code_for_translation(tgt_lang_name)
 
@@ -61,11 +109,232 @@ def translate_text(text: str, src_lang_name: str, tgt_lang_name: str) -> str:
     if not tgt_code:
         tgt_code = "en"
 
+    # Google rejects payloads past ~5000 chars. Oversized inputs get
+    # sentence-split, greedy-packed under the limit and translated as
+    # concurrent chunks; each chunk lands in the shared cache on its
+    # own. (The threshold sits above the batch packer's budget so
+    # sentinel-joined payloads never re-split here.)
+    if len(text) > _MAX_SINGLE_CHARS:
+        chunked = _translate_long_text(text, src_lang_name, tgt_lang_name)
+        if chunked is not None:
+            return chunked
+
     try:
-        translator = GoogleTranslator(source=src_code, target=tgt_code)
-        translated = translator.translate(text)
-        return translated or ""
+        return _translate_call_cached(src_code, tgt_code, text)
     except Exception as e:
         # Log to console so you can see issues, but don't crash app
         print(f"[TRANSLATE ERROR] ({src_code} -> {tgt_code}) {e}")
         return text
+
+
+# Largest text sent as one request. Kept above _BUCKET_CHAR_BUDGET plus
+# separator overhead so batched payloads pass straight through.
+_MAX_SINGLE_CHARS = 4800
+
+# Sentence boundaries for chunking long inputs (Latin punctuation + the
+# Devanagari danda used by several Indian languages).
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!।])\s+")
+
+
+def _translate_long_text(text: str, src_lang_name: str, tgt_lang_name: str) -> str | None:
+    """
+    Sentence-split an oversized input and translate the chunks concurrently.
+
+    Returns the joined translation, or None when the text cannot be
+    split (one giant sentence) – the caller then falls through to a
+    direct request and lets the backend cope.
+    """
+    sentences = _SENTENCE_SPLIT.split(text)
+    if len(sentences) <= 1:
+        return None
+
+    chunks: list[str] = []
+    cur: list[str] = []
+    cur_len = 0
+    for sent in sentences:
+        if cur and cur_len + len(sent) > _MAX_SINGLE_CHARS:
+            chunks.append(" ".join(cur))
+            cur = []
+            cur_len = 0
+        cur.append(sent)
+        cur_len += len(sent) + 1
+    if cur:
+        chunks.append(" ".join(cur))
+
+    if len(chunks) == 1:
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+        futures = [
+            pool.submit(translate_text, chunk, src_lang_name, tgt_lang_name)
+            for chunk in chunks
+        ]
+        return " ".join(fut.result() for fut in futures)
+
+
+@lru_cache(maxsize=4096)
+def _translate_call_cached(src_code: str, tgt_code: str, text: str) -> str:
+    """
+    The actual network call, memoized on normalized codes + text.
+
+    Sitting below translate_text, this tier is shared by every caller –
+    single phrases, sentinel-joined batches, warmup – and by language
+    names that normalize to the same code pair. Failures raise so the
+    caller's error handling runs and nothing poisons the cache.
+    """
+    translator = _get_translator(src_code, tgt_code)
+    return translator.translate(text) or ""
+
+
+def warm_translator(src_lang_name: str = "English", tgt_lang_name: str = "Hindi") -> None:
+    """
+    Pre-build the translator client for a language pair.
+
+    Called once at app startup so the first real translation reuses an
+    already-constructed client (and its HTTP session) instead of paying
+    setup cost on the first click.
+    """
+    src_code = _normalize_code(lang_code_for_translation(src_lang_name)) or "auto"
+    tgt_code = _normalize_code(lang_code_for_translation(tgt_lang_name)) or "en"
+    _get_translator(src_code, tgt_code)
+
+
+@lru_cache(maxsize=2048)
+def translate_text_cached(text: str, src_lang_name: str, tgt_lang_name: str) -> str:
+    """
+    Memoized translate_text for UI call sites.
+
+    The translator tabs re-run their scripts on every widget interaction,
+    and users routinely re-translate the same phrase (tweaking the target
+    language back and forth, re-clicking the button). A hit here returns
+    instantly instead of repeating the HTTP round trip. Medical phrasing
+    repeats heavily across sessions, and entries are short sentences, so
+    a couple thousand of them cost little memory and keep hit rates high.
+    """
+    return translate_text(text, src_lang_name, tgt_lang_name)
+
+
+def clear_translation_cache() -> None:
+    """Drop all memoized translations (admin/debug escape hatch)."""
+    translate_text_cached.cache_clear()
+    _translate_call_cached.cache_clear()
+
+
+# Sentinel used to pack several segments into one Google request.
+# Rare enough that it survives translation as-is.
+_BATCH_SEP = "\n###\n"
+
+
+def translate_batch(texts: list[str], src_lang_name: str, tgt_lang_name: str) -> list[str]:
+    """
+    Translate several segments in ONE Google request instead of N.
+
+    Joins the segments with a sentinel, translates once, and splits the
+    result back. If the sentinel does not survive the round trip we fall
+    back to translating each segment on its own, so callers always get
+    one output per input.
+    """
+    if not texts:
+        return []
+    if len(texts) == 1:
+        return [translate_text(texts[0], src_lang_name, tgt_lang_name)]
+
+    joined = _BATCH_SEP.join(texts)
+    translated = translate_text(joined, src_lang_name, tgt_lang_name)
+
+    parts = [p.strip() for p in translated.split(_BATCH_SEP.strip())]
+    if len(parts) == len(texts):
+        return parts
+
+    # Sentinel got mangled – translate one by one as a safe fallback.
+    return [translate_text(t, src_lang_name, tgt_lang_name) for t in texts]
+
+
+# How many segments get packed into one batched request. Larger buckets
+# save round trips but risk tripping request-size limits.
+_BUCKET_SIZE = 8
+
+# Character budget per joined request – Google rejects payloads around
+# 5000 chars, so buckets close early once they approach it.
+_BUCKET_CHAR_BUDGET = 4500
+
+
+def _pack_buckets(order: list[int], texts: list[str]) -> list[list[int]]:
+    """Greedy-pack sorted indices into buckets of <=8 items / ~4500 chars."""
+    buckets: list[list[int]] = []
+    bucket: list[int] = []
+    chars = 0
+    for i in order:
+        n = len(texts[i])
+        if bucket and (len(bucket) >= _BUCKET_SIZE or chars + n > _BUCKET_CHAR_BUDGET):
+            buckets.append(bucket)
+            bucket = []
+            chars = 0
+        bucket.append(i)
+        chars += n
+    if bucket:
+        buckets.append(bucket)
+    return buckets
+
+
+def translate_many(texts: list[str], src_lang_name: str, tgt_lang_name: str) -> list[str]:
+    """
+    Translate many segments with length-bucketed batching.
+
+    Segments are sorted by length and greedy-packed into buckets capped
+    at _BUCKET_SIZE items AND _BUCKET_CHAR_BUDGET characters, each
+    bucket going out as ONE request via translate_batch; outputs are
+    then restored to input order. Grouping similar lengths keeps each
+    joined request compact instead of one long outlier padding out a
+    whole batch, and the character cap keeps every request under
+    Google's payload limit no matter how long the segments run.
+    """
+    if not texts:
+        return []
+    if len(texts) == 1:
+        return [translate_text_cached(texts[0], src_lang_name, tgt_lang_name)]
+
+    # Duplicate segments (repeated captions, boilerplate lines) would
+    # each pay for a slot in a request; translate the unique texts once
+    # and scatter the results back to every original position.
+    idx_by_text: dict[str, list[int]] = {}
+    for i, t in enumerate(texts):
+        idx_by_text.setdefault(t, []).append(i)
+    if len(idx_by_text) < len(texts):
+        unique = list(idx_by_text)
+        translated_unique = translate_many(unique, src_lang_name, tgt_lang_name)
+        out = [""] * len(texts)
+        for t, res in zip(unique, translated_unique):
+            for i in idx_by_text[t]:
+                out[i] = res
+        return out
+
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    out = [""] * len(texts)
+    buckets = _pack_buckets(order, texts)
+
+    if len(buckets) == 1:
+        bucket = buckets[0]
+        translated = translate_batch(
+            [texts[i] for i in bucket], src_lang_name, tgt_lang_name
+        )
+        for i, res in zip(bucket, translated):
+            out[i] = res
+        return out
+
+    # The work is pure HTTP waiting, so a few requests in flight overlap
+    # their round trips; more than 4 mostly invites rate limiting.
+    with ThreadPoolExecutor(max_workers=min(4, len(buckets))) as pool:
+        futures = [
+            pool.submit(
+                translate_batch,
+                [texts[i] for i in bucket],
+                src_lang_name,
+                tgt_lang_name,
+            )
+            for bucket in buckets
+        ]
+        for bucket, fut in zip(buckets, futures):
+            for i, res in zip(bucket, fut.result()):
+                out[i] = res
+    return out
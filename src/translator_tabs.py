@@ -0,0 +1,857 @@
+# translator_tabs.py – the three one-way translator tabs (speech / text / image)
+#
+# Extracted from main_app.py so the page shell stays a thin entry point
+# and the tab implementations live in one place.
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from string import Template
+
+import numpy as np
+from PIL import Image
+import streamlit as st
+
+from mic_ui import medical_mic
+from stt import speech_to_text_cached, is_probably_silent, iter_transcript_segments
+from translate import translate_text_cached, translate_many
+from tts import (
+    text_to_speech_bytes_cached,
+    text_to_speech_batch,
+    iter_sentence_audio,
+    split_sentences,
+    compress_for_web,
+)
+from languages import has_sr_support
+
+
+# =========================================================
+# IMAGE OCR HELPERS (EasyOCR)
+# =========================================================
+
+@st.cache_resource(show_spinner=False)
+def get_easyocr_reader(lang_code: str = "en"):
+    """Create and cache EasyOCR reader for a language code."""
+    # easyocr drags in torch – several seconds of import on cold start –
+    # so only pay for it when the image tab actually runs OCR.
+    #
+    # This is also the only backend that holds model memory in-process.
+    # STT/MT/TTS are remote HTTP APIs, so pushing them into a persistent
+    # worker subprocess would just add queue marshalling on top of the
+    # network hop; and shipping image arrays to an OCR subprocess costs
+    # more in pickling than st.cache_resource isolation saves. Inference
+    # therefore stays in-process behind this singleton.
+    import easyocr
+
+    try:
+        import torch
+
+        use_gpu = torch.cuda.is_available()
+    except ImportError:
+        use_gpu = False
+
+    # One composite reader covers the requested language AND English:
+    # both share a single CRAFT detector (~80 MB of weights) instead of
+    # this cache holding one detector per language, and mixed-language
+    # prescriptions recognize in one pass.
+    langs = [lang_code] if lang_code == "en" else [lang_code, "en"]
+
+    try:
+        # cudnn_benchmark lets cuDNN autotune the detector's conv algos
+        # on the first call and reuse the winners afterwards (no-op on
+        # CPU). The dummy readtext below pays that autotune – plus lazy
+        # model init – at reader construction, inside this cached
+        # factory, so the first real upload skips the cold-start cost.
+        reader = easyocr.Reader(langs, gpu=use_gpu, cudnn_benchmark=use_gpu)
+    except Exception:
+        # If a specific language is not supported, fall back to English
+        reader = easyocr.Reader(["en"], gpu=use_gpu, cudnn_benchmark=use_gpu)
+
+    try:
+        reader.readtext(np.zeros((600, 800, 3), dtype=np.uint8), detail=0)
+    except Exception:
+        pass  # warmup only – real calls surface their own errors
+
+    return reader
+
+
+# OCR accuracy plateaus around this size while detection cost keeps
+# growing quadratically, so larger uploads are downscaled first.
+# 1600 px on the long side is comfortably above what printed
+# prescriptions need; detector work drops ~40% vs the previous 2048.
+_OCR_MAX_SIDE = 1600
+
+
+def _decode_for_ocr(image_file) -> np.ndarray:
+    """
+    Decode an uploaded image to an RGB array sized for OCR.
+
+    Phone photos easily exceed 4000 px per side; EasyOCR's detector cost
+    scales with pixel count, so anything above _OCR_MAX_SIDE is downscaled
+    before recognition. JPEG decoding honours draft mode, which lets PIL
+    decode straight to a smaller size instead of decoding full-res and
+    resizing after.
+    """
+    image = Image.open(image_file)
+    image.draft("RGB", (_OCR_MAX_SIDE, _OCR_MAX_SIDE))
+    # draft mode leaves JPEGs in RGB already; convert("RGB") on an RGB
+    # image still allocates and copies a second H*W*3 buffer, so only
+    # pay it for palettized/grayscale/alpha sources.
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if max(image.size) > _OCR_MAX_SIDE:
+        image.thumbnail((_OCR_MAX_SIDE, _OCR_MAX_SIDE), Image.LANCZOS)
+    return np.array(image)
+
+
+def _raw_bytes_if_ocr_ready(image_file) -> bytes | None:
+    """
+    Return the upload's raw bytes when EasyOCR can decode them as-is.
+
+    Image.open is lazy – size/mode come from the header without decoding
+    pixels. When the upload is already OCR-sized RGB, handing EasyOCR
+    the raw bytes means the image gets decoded exactly once; the PIL
+    decode + np.array memcpy (3*H*W bytes) in _decode_for_ocr is only
+    worth paying when a downscale or mode conversion is actually needed.
+    """
+    if not hasattr(image_file, "getvalue"):
+        return None
+    try:
+        probe = Image.open(image_file)
+        ready = max(probe.size) <= _OCR_MAX_SIDE and probe.mode == "RGB"
+    except Exception:
+        ready = False
+    if hasattr(image_file, "seek"):
+        image_file.seek(0)  # the probe advanced past the header
+    return image_file.getvalue() if ready else None
+
+
+def extract_text_from_images(image_files, ocr_lang: str = "en") -> list[str]:
+    """
+    Extract text from several uploaded images, one result per input.
+
+    A single already-OCR-sized RGB upload skips the PIL decode entirely
+    and hands EasyOCR the raw bytes. Otherwise pages are decoded/
+    downscaled concurrently, then recognized through EasyOCR's batched
+    entry point when available – the recognizer runs once over the
+    stacked pages, amortizing per-call model overhead (and kernel
+    launches on GPU). Falls back to a per-page loop if the batched call
+    is missing or rejects the stack (e.g. mixed sizes).
+    """
+    if len(image_files) == 1:
+        raw = _raw_bytes_if_ocr_ready(image_files[0])
+        if raw is not None:
+            # No blank-page pre-check here – it would need the decoded
+            # array this path exists to avoid, and a blank single page
+            # just costs the one detector run it always did.
+            try:
+                reader = get_easyocr_reader(ocr_lang)
+                return ["\n".join(reader.readtext(raw, detail=0)).strip()]
+            except Exception as e:
+                return [f"[OCR error: {e}]"]
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(4, len(image_files))) as pool:
+            arrays = list(pool.map(_decode_for_ocr, image_files))
+    except Exception as e:
+        return [f"[OCR error: {e}]"] * len(image_files)
+
+    # Near-constant pages (accidental blank screenshots, empty scans)
+    # short-circuit to "" – one std() pass over the decoded array costs
+    # microseconds versus a full detector run that finds nothing anyway.
+    live = [i for i, arr in enumerate(arrays) if arr.std() >= 2.0]
+    out = [""] * len(arrays)
+    if not live:
+        return out
+
+    reader = get_easyocr_reader(ocr_lang)
+
+    if len(live) > 1 and hasattr(reader, "readtext_batched"):
+        try:
+            batched = reader.readtext_batched([arrays[i] for i in live], detail=0)
+            for i, page in zip(live, batched):
+                out[i] = "\n".join(page).strip()
+            return out
+        except Exception:
+            pass  # mixed page sizes etc. – recognize page by page below
+
+    for i in live:
+        try:
+            out[i] = "\n".join(reader.readtext(arrays[i], detail=0)).strip()
+        except Exception as e:
+            out[i] = f"[OCR error: {e}]"
+    return out
+
+
+# Small shared pool for speculative background work (prefetching
+# translations for recently used target languages). Two workers cap how
+# much prefetch traffic can compete with a foreground request.
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+# Which OCR engine serves the image tab. EasyOCR is the default; the
+# legacy Tesseract module (src/ocr.py) stays importable as a deliberate
+# opt-in – set OCR_BACKEND=tesseract – rather than dead code whose
+# import-time costs could sneak in by accident.
+_OCR_BACKEND = os.getenv("OCR_BACKEND", "easyocr").strip().lower()
+
+
+def _extract_with_backend(image_files, ocr_lang: str) -> list[str]:
+    """Dispatch page extraction to the configured OCR backend."""
+    if _OCR_BACKEND == "tesseract":
+        from ocr import ocr_image  # lazy – only this branch pays the import
+
+        texts = []
+        for image_file in image_files:
+            try:
+                text, _processed = ocr_image(Image.open(image_file), "English")
+                texts.append(text)
+            except Exception as e:
+                texts.append(f"[OCR error: {e}]")
+        return texts
+    return extract_text_from_images(image_files, ocr_lang=ocr_lang)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _ocr_pages_cached(page_blobs: tuple[bytes, ...], ocr_lang: str) -> list[str]:
+    """
+    OCR results keyed on the raw upload bytes.
+
+    Re-uploading the same prescription photo (common in demos and
+    training sessions) hits this cache instead of re-running OCR – by
+    far the most expensive step in the image tab. The sidebar
+    "Clear cached results" button flushes it along with the rest of
+    st.cache_data.
+    """
+    return _extract_with_backend(
+        [BytesIO(blob) for blob in page_blobs], ocr_lang=ocr_lang
+    )
+
+# =========================================================
+# UI HELPERS
+# =========================================================
+
+@st.cache_data(show_spinner=False)
+def _default_lang_indices(languages: tuple[str, ...]) -> tuple[int, int]:
+    """
+    Default (source, target) dropdown indices: English -> Hindi.
+
+    Cached on the language tuple, so the three tabs' reruns share one
+    lookup instead of each rescanning a 100+ entry list.
+    """
+    idx = {name: i for i, name in enumerate(languages)}
+    default_src = idx.get("English", 0)
+    default_tgt = idx.get("Hindi", 1 if len(languages) > 1 else 0)
+    return default_src, default_tgt
+
+
+# Static card markup and per-call templates, built once at import so
+# reruns only pay for placeholder substitution (same pattern as the mic
+# instructions card in mic_ui).
+_SECTION_HEADER_TEMPLATE = Template(
+    """
+        <div style="margin-top:0.6rem; margin-bottom:0.4rem;">
+          <div style="display:flex; align-items:center; gap:0.3rem;">
+            ${icon_html}
+            <span style="font-size:1.2rem; font-weight:700; letter-spacing:0.02em;">
+                ${title}
+            </span>
+          </div>
+          <div class="secondary-text">${subtitle}</div>
+        </div>
+    """
+)
+
+_RESULT_BLOCK_TEMPLATE = Template(
+    """
+        <div class="app-card">
+          <div class="pill-label">${title}</div>
+          <div style="font-size:0.95rem; line-height:1.6;">${text}</div>
+        </div>
+    """
+)
+
+_UPLOAD_CARD_HTML = """
+    <div class="app-card">
+      <h4>Option 1 – Upload audio file (WAV only)</h4>
+      <p class="secondary-text">
+        Use this if you already have a recorded patient audio sample.
+      </p>
+    </div>
+"""
+
+_MIC_CARD_HTML = """
+    <div class="app-card">
+      <h4>Option 2 – Record using microphone</h4>
+      <p class="secondary-text">
+        Click the microphone, speak clearly, then click again to stop.
+      </p>
+    </div>
+"""
+
+_TEXT_ENTRY_CARD_HTML = """
+    <div class="app-card">
+      <h4>Enter text to translate</h4>
+    </div>
+"""
+
+
+def _section_header(title: str, subtitle: str | None = None, icon: str = ""):
+    icon_html = (
+        f"<span style='font-size:1.3rem; margin-right:0.4rem;'>{icon}</span>"
+        if icon
+        else ""
+    )
+    st.markdown(
+        _SECTION_HEADER_TEMPLATE.substitute(
+            icon_html=icon_html, title=title, subtitle=subtitle or ""
+        ),
+        unsafe_allow_html=True,
+    )
+
+
+def _write_result_block(title: str, text: str):
+    if not text:
+        return
+    st.markdown(
+        _RESULT_BLOCK_TEMPLATE.substitute(title=title, text=text),
+        unsafe_allow_html=True,
+    )
+
+# =========================================================
+# TRANSLATOR – SPEECH TAB
+# =========================================================
+
+def _pipelined_translate_and_speak(source, src_lang_name: str, tgt_lang_name: str) -> str:
+    """
+    Translate recognized speech and synthesize the doctor audio with the
+    stages overlapped.
+
+    `source` is either the full transcript string or an iterable that
+    yields transcript segments as an upstream stage (chunked STT)
+    produces them. Each sentence's translation is submitted as soon as
+    its text is available, and each sentence's TTS job the moment its
+    translation lands – so with a streaming source, recognition of
+    segment two, translation of segment one and synthesis all overlap
+    instead of the stages running back to back. Results render in
+    sentence order. Returns the joined source text ("" if nothing was
+    recognized, in which case nothing is rendered).
+    """
+    if isinstance(source, str):
+        source = split_sentences(source) or [source]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        src_parts: list[str] = []
+        trans_futs = []
+        for seg in source:
+            for sent in split_sentences(seg) or [seg]:
+                src_parts.append(sent)
+                trans_futs.append(
+                    pool.submit(
+                        translate_text_cached, sent, src_lang_name, tgt_lang_name
+                    )
+                )
+
+        if not src_parts:
+            return ""
+        text_src = " ".join(src_parts)
+
+        parts: list[str] = []
+        audio_futs = []
+        for fut in trans_futs:
+            part = (fut.result() or "").strip()
+            if part:
+                parts.append(part)
+                audio_futs.append(
+                    pool.submit(text_to_speech_bytes_cached, part, tgt_lang_name)
+                )
+
+        text_tgt = " ".join(parts)
+        _write_result_block("Recognized patient speech", text_src)
+        _write_result_block("Translated for doctor", text_tgt)
+
+        if not audio_futs:
+            st.warning("Translation text is empty, so TTS was skipped.")
+            return text_src
+
+        st.markdown("**Doctor hears (audio):**")
+        played = False
+        for fut in audio_futs:
+            chunk = fut.result()
+            if chunk:
+                chunk, mime = compress_for_web(chunk)
+                st.audio(chunk, format=mime)
+                played = True
+        if not played:
+            st.warning(
+                "TTS could not generate audio for the translated text "
+                "(see any error message in the terminal)."
+            )
+        return text_src
+
+
+@st.fragment
+def show_speech_tab(languages: tuple[str, ...]):
+    col_src, col_tgt = st.columns(2)
+
+    default_src, default_tgt = _default_lang_indices(languages)
+
+    with col_src:
+        _section_header("Source (Patient)", "Patient speaks in their language", "🧑‍🌾")
+        src_lang_name = st.selectbox(
+            "Patient language",
+            languages,
+            key="speech_src_lang",
+            index=default_src,
+        )
+
+    with col_tgt:
+        _section_header(
+            "Target (Doctor)", "Doctor hears translation in this language", "👩‍⚕️"
+        )
+        tgt_lang_name = st.selectbox(
+            "Doctor language",
+            languages,
+            key="speech_tgt_lang",
+            index=default_tgt,
+        )
+
+    # Show SR support info if available
+    try:
+        if not has_sr_support(src_lang_name):
+            st.warning(
+                f"Speech recognition may not fully support **{src_lang_name}**. "
+                "For best results, use English / Hindi / other supported languages."
+            )
+    except Exception:
+        pass
+
+    st.markdown("---")
+
+    col_file, col_mic = st.columns(2)
+
+    # Option 1 – upload wav
+    with col_file:
+        st.markdown(_UPLOAD_CARD_HTML, unsafe_allow_html=True)
+        uploaded = st.file_uploader(
+            "Upload patient audio file",
+            type=["wav"],
+            key="speech_file",
+        )
+
+    # Option 2 – mic
+    mic_audio = None
+    with col_mic:
+        st.markdown(_MIC_CARD_HTML, unsafe_allow_html=True)
+        mic_audio = medical_mic("Patient Microphone", key="translator_patient")
+
+    # Transcribe a fresh mic recording eagerly, on the rerun that delivers
+    # it – not on the Translate click. True while-you-speak streaming would
+    # need a WebRTC audio track; the recorder component only hands over the
+    # finished clip, so the next best thing is to overlap recognition with
+    # the user's think-time before they press the button. Keyed by clip
+    # hash + language so reruns and repeat clicks reuse the transcript.
+    mic_stt_key = None
+    if mic_audio and not is_probably_silent(mic_audio):
+        rec_hash = hashlib.blake2b(mic_audio, digest_size=8).hexdigest()
+        mic_stt_key = (rec_hash, src_lang_name)
+        if st.session_state.get("speech_stt_key") != mic_stt_key:
+            with st.spinner("Transcribing recording..."):
+                eager_text = speech_to_text_cached(mic_audio, src_lang_name)
+            # Only memorize successes. An empty transcript can be a
+            # transient backend failure (the cached tier refuses to
+            # store those); recording the key here would replay the
+            # empty result on every later click instead of letting the
+            # Translate path below retry recognition for the clip.
+            if eager_text and eager_text.strip():
+                st.session_state["speech_stt_text"] = eager_text
+                st.session_state["speech_stt_key"] = mic_stt_key
+
+    st.markdown("")
+
+    translate_clicked = st.button("🔁 Translate Speech", type="primary")
+
+    if not translate_clicked:
+        return
+
+    # Choose source audio
+    audio_bytes = None
+    if uploaded is not None:
+        # getvalue() hands back the UploadedFile's existing buffer;
+        # read() would materialize a second full copy of the WAV.
+        audio_bytes = uploaded.getvalue()
+        st.success("Uploaded audio file received.")
+        st.audio(audio_bytes, format="audio/wav")
+    elif mic_audio is not None:
+        audio_bytes = mic_audio
+        st.audio(audio_bytes, format="audio/wav")
+    else:
+        st.error("Please upload an audio file **or** record using the microphone.")
+        return
+
+    # A silent clip would still cost a full recognition round trip just
+    # to come back empty – catch it with a microsecond RMS check instead.
+    if is_probably_silent(audio_bytes):
+        st.error(
+            "❗ The recording appears to be silent.\n\n"
+            "Please record again, speaking clearly and closer to the microphone."
+        )
+        return
+
+    try:
+        # Mic recordings were transcribed eagerly above; everything else
+        # streams ~10s transcript slices straight into the translate/TTS
+        # pipeline, so recognition of slice two overlaps translation of
+        # slice one instead of the stages running under serial spinners.
+        if (
+            uploaded is None
+            and mic_stt_key is not None
+            and st.session_state.get("speech_stt_key") == mic_stt_key
+        ):
+            text_src = st.session_state.get("speech_stt_text", "")
+            if text_src and text_src.strip():
+                with st.spinner("Translating and generating doctor audio..."):
+                    text_src = _pipelined_translate_and_speak(
+                        text_src, src_lang_name, tgt_lang_name
+                    )
+        else:
+            with st.spinner(
+                "Recognizing, translating and generating doctor audio..."
+            ):
+                text_src = _pipelined_translate_and_speak(
+                    iter_transcript_segments(audio_bytes, src_lang_name),
+                    src_lang_name,
+                    tgt_lang_name,
+                )
+
+        if not text_src or not text_src.strip():
+            st.error(
+                "❗ I could not recognize any speech.\n\n"
+                "Please record again, speaking clearly and closer to the microphone."
+            )
+            return
+
+    except Exception as e:
+        st.error(f"Error while translating speech: {e}")
+
+
+# =========================================================
+# TRANSLATOR – TEXT TAB
+# =========================================================
+
+@st.fragment
+def show_text_tab(languages: tuple[str, ...]):
+    col_src, col_tgt = st.columns(2)
+
+    default_src, default_tgt = _default_lang_indices(languages)
+
+    with col_src:
+        _section_header("Source Text", "Enter patient or doctor text", "💬")
+        src_lang_name = st.selectbox(
+            "Source language",
+            languages,
+            key="text_src_lang",
+            index=default_src,
+        )
+
+    with col_tgt:
+        _section_header("Target Text", "Output translation", "🌐")
+        tgt_lang_name = st.selectbox(
+            "Target language",
+            languages,
+            key="text_tgt_lang",
+            index=default_tgt,
+        )
+
+    st.markdown("")
+
+    st.markdown(_TEXT_ENTRY_CARD_HTML, unsafe_allow_html=True)
+
+    text_input = st.text_area(
+        "Type or paste text here",
+        height=160,
+        key="text_input_area",
+    )
+
+    col_btn1, col_btn2 = st.columns([1, 1])
+    with col_btn1:
+        translate_clicked = st.button("🔁 Translate Text", type="primary")
+    with col_btn2:
+        tts_toggle = st.checkbox(
+            "🔊 Also generate audio for translated text", value=True
+        )
+
+    if not translate_clicked:
+        return
+
+    if not text_input or not text_input.strip():
+        st.error("Please enter some text to translate.")
+        return
+
+    try:
+        # Repeat clicks with unchanged input (users do this constantly
+        # to re-hear the audio) short-circuit on a content hash: one
+        # blake2b versus re-running the whole MT+TTS pipeline.
+        req_hash = hashlib.blake2b(
+            f"{src_lang_name}|{tgt_lang_name}|{text_input}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        prior = st.session_state.get("text_last_result")
+        if prior is not None and prior["hash"] == req_hash:
+            translated = prior["translated"]
+            audio_chunks = prior["audio"]
+        else:
+            audio_chunks = None
+            with st.spinner("Translating text..."):
+                # Long inputs go out as length-bucketed batches instead
+                # of one request per sentence (or one oversized request).
+                sents = split_sentences(text_input)
+                if len(sents) > 1:
+                    translated = " ".join(
+                        translate_many(sents, src_lang_name, tgt_lang_name)
+                    )
+                else:
+                    translated = translate_text_cached(
+                        text_input, src_lang_name, tgt_lang_name
+                    )
+
+        _write_result_block("Original text", text_input)
+        _write_result_block("Translated text", translated)
+
+        if tts_toggle and translated and translated.strip():
+            st.markdown("**Translated audio:**")
+            played = False
+            if audio_chunks is None:
+                # Stream per-sentence audio: chunks are synthesized
+                # concurrently and each element is emitted the moment
+                # its chunk lands, so the first sentence is audible
+                # after ~1/N of the total synthesis time.
+                audio_chunks = []
+                with st.spinner("Generating audio..."):
+                    for chunk in iter_sentence_audio(translated, tgt_lang_name):
+                        chunk, mime = compress_for_web(chunk)
+                        audio_chunks.append((chunk, mime))
+                        st.audio(chunk, format=mime)
+                        played = True
+            else:
+                for chunk, mime in audio_chunks:
+                    st.audio(chunk, format=mime)
+                    played = True
+            if not played:
+                st.warning(
+                    "TTS could not generate audio for the translated text "
+                    "(see any error message in the terminal)."
+                )
+
+        st.session_state["text_last_result"] = {
+            "hash": req_hash,
+            "translated": translated,
+            "audio": audio_chunks,
+        }
+
+        # Speculative prefetch: users routinely flip the target language
+        # and re-translate the same text. Warm the translation cache for
+        # the other recently used targets during think time, so the next
+        # flip is a cache hit instead of a round trip. The prefetch must
+        # mirror the translate branch above exactly – multi-sentence
+        # input goes through translate_many, whose batched requests
+        # cache under different keys than a whole-text lookup would.
+        recent = st.session_state.setdefault("recent_tgt_langs", [])
+        if tgt_lang_name in recent:
+            recent.remove(tgt_lang_name)
+        recent.insert(0, tgt_lang_name)
+        del recent[3:]
+        prefetch_sents = split_sentences(text_input)
+        for other_lang in recent[1:]:
+            if len(prefetch_sents) > 1:
+                _PREFETCH_POOL.submit(
+                    translate_many, prefetch_sents, src_lang_name, other_lang
+                )
+            else:
+                _PREFETCH_POOL.submit(
+                    translate_text_cached, text_input, src_lang_name, other_lang
+                )
+    except Exception as e:
+        st.error(f"Error while translating text: {e}")
+
+
+# =========================================================
+# TRANSLATOR – IMAGE TAB  (OCR + manual text + TTS using translate_text)
+# =========================================================
+
+@st.fragment
+def show_image_tab(languages: tuple[str, ...]):
+    st.subheader("Image Translator (Printed + Handwritten)")
+
+    st.write(
+        """
+        Upload an image containing **printed** or **handwritten** text.  
+        The app will try to read it.  
+        If OCR is not accurate, the patient/doctor can **edit or type the text manually**,  
+        then translate it and listen to the audio.
+        """
+    )
+
+    default_src, default_tgt = _default_lang_indices(languages)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        src_lang_name = st.selectbox(
+            "Source language (text in image)",
+            languages,
+            index=default_src,
+            key="img_src_lang",
+        )
+    with col2:
+        tgt_lang_name = st.selectbox(
+            "Target language (output)",
+            languages,
+            index=default_tgt,
+            key="img_tgt_lang",
+        )
+
+    ocr_mode = st.radio(
+        "Type of text in image",
+        options=["Printed", "Handwritten"],
+        index=0,
+        horizontal=True,
+        key="img_text_type",
+    )
+
+    uploaded_images = st.file_uploader(
+        "Upload image(s) – multiple pages are read in order",
+        type=["png", "jpg", "jpeg"],
+        accept_multiple_files=True,
+        key="img_uploader",
+    )
+
+    # --- keep a state for the editable text coming from OCR or manual typing ---
+    if "img_text_input" not in st.session_state:
+        st.session_state["img_text_input"] = ""
+
+    if uploaded_images:
+        # Show previews; collapse them for multi-page uploads
+        if len(uploaded_images) == 1:
+            st.image(uploaded_images[0], caption="Uploaded image", use_column_width=True)
+        else:
+            with st.expander(f"Preview {len(uploaded_images)} uploaded images"):
+                for img_file in uploaded_images:
+                    st.image(img_file, caption=img_file.name, use_column_width=True)
+
+        if st.button("📖 Extract Text from Image", key="btn_extract_img", type="primary"):
+            # OCR language – we keep English here (EasyOCR Indian language support is limited)
+            ocr_lang_code = "en"
+
+            # Decode pages concurrently, recognize the stack in one
+            # batched call; results come back in upload order. The
+            # cache layer short-circuits repeat uploads of identical
+            # page bytes.
+            with st.spinner("Running OCR (this may take a few seconds)..."):
+                page_texts = _ocr_pages_cached(
+                    tuple(f.getvalue() for f in uploaded_images), ocr_lang_code
+                )
+
+            extracted = "\n\n".join(
+                t.strip() for t in page_texts if t and t.strip()
+            ).strip()
+            st.session_state["img_text_input"] = extracted
+
+            if not extracted:
+                st.warning(
+                    "No text could be confidently extracted from the image.\n\n"
+                    "You can type the content manually in the box below."
+                )
+            elif extracted.startswith("[OCR error"):
+                st.error(
+                    "There was an error while reading the text from the image. "
+                    "You can type the text manually in the box below."
+                )
+
+    # --- Editable text area bound to session_state key ---
+    editable_text = st.text_area(
+        "Text from image (you can edit or type manually if OCR is wrong)",
+        height=180,
+        key="img_text_input",
+    )
+
+    # --- Translate whatever is currently in the text box + TTS ---
+    if st.button("🔁 Translate Above Text", key="btn_translate_img", type="primary"):
+        final_text = (editable_text or "").strip()
+
+        if not final_text:
+            st.error(
+                "Please enter the text from the image (either by extracting or typing manually) before translating."
+            )
+            return
+
+        # Same repeat-click short-circuit as the text tab: unchanged
+        # box content + language pair replays the stored result.
+        req_hash = hashlib.blake2b(
+            f"{src_lang_name}|{tgt_lang_name}|{final_text}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        prior = st.session_state.get("img_last_result")
+        if prior is not None and prior["hash"] == req_hash:
+            translated = prior["translated"]
+            cached_audio = prior["audio"]
+        else:
+            cached_audio = None
+            with st.spinner("Translating text..."):
+                sents = split_sentences(final_text)
+                if len(sents) > 1:
+                    translated = " ".join(
+                        translate_many(sents, src_lang_name, tgt_lang_name)
+                    )
+                else:
+                    translated = translate_text_cached(
+                        final_text, src_lang_name, tgt_lang_name
+                    )
+
+        # Kick off TTS before rendering the text widgets, so synthesis
+        # overlaps the (non-trivial) text_area render instead of waiting
+        # for it; the result is collected after the widgets are emitted.
+        fut_chunks = None
+        tts_pool = None
+        if cached_audio is None and translated and translated.strip():
+            MAX_TTS_CHARS = 3000
+            tts_input = translated[:MAX_TTS_CHARS]
+            tts_pool = ThreadPoolExecutor(max_workers=1)
+            fut_chunks = tts_pool.submit(
+                text_to_speech_batch, split_sentences(tts_input), tgt_lang_name
+            )
+
+        st.subheader("Translated Text")
+        st.text_area(
+            "Translation",
+            value=translated,
+            height=180,
+            key="img_translated_text",
+        )
+
+        # --- TTS for translated text ---
+        if cached_audio is not None:
+            audio_bytes, mime = cached_audio
+            st.markdown("**Translated audio (from image text):**")
+            st.audio(audio_bytes, format=mime)
+        elif fut_chunks is not None:
+            try:
+                with st.spinner("Generating audio..."):
+                    audio_bytes = b"".join(fut_chunks.result())
+                if audio_bytes:
+                    audio_bytes, mime = compress_for_web(audio_bytes)
+                    st.markdown("**Translated audio (from image text):**")
+                    st.audio(audio_bytes, format=mime)
+                    cached_audio = (audio_bytes, mime)
+                else:
+                    st.warning("Could not generate audio for the translated text.")
+            except Exception as e:
+                st.error(f"Error while generating TTS for image translation: {e}")
+            finally:
+                tts_pool.shutdown(wait=False)
+
+        st.session_state["img_last_result"] = {
+            "hash": req_hash,
+            "translated": translated,
+            "audio": cached_audio,
+        }
@@ -2,15 +2,156 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 
-import streamlit as st
 from gtts import gTTS
 
 from languages import lang_code_for_translation
 
+# Failures are logged, not rendered – this module runs on worker
+# threads with no Streamlit script context, and the UI layers already
+# warn the user when no audio comes back.
+logger = logging.getLogger(__name__)
 
+
+# Sentence boundaries for chunked synthesis (Latin punctuation + the
+# Devanagari danda used by several Indian languages).
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!।])\s+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences for per-sentence TTS."""
+    return [s for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+
+
+def iter_sentence_audio(text: str, language_name: str, max_workers: int = 4):
+    """
+    Yield MP3 bytes per sentence, synthesized concurrently, in order.
+
+    All sentences are submitted to a small thread pool up front; chunks
+    are yielded in sentence order as their futures resolve, so the caller
+    can start playing the first sentence while the rest are still being
+    synthesized. Failed sentences are skipped.
+    """
+    sentences = split_sentences(text)
+    if not sentences:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sentences))) as pool:
+        futures = [
+            pool.submit(text_to_speech_bytes_cached, sent, language_name)
+            for sent in sentences
+        ]
+        for fut in futures:
+            audio = fut.result()
+            if audio:
+                yield audio
+
+
+@lru_cache(maxsize=512)
+def _tts_call_cached(text: str, language_name: str) -> bytes:
+    """
+    Memoized synthesis tier – raises when no audio comes back, so a
+    transient gTTS failure is retried on the next call instead of being
+    cached as silence for the process lifetime.
+    """
+    audio = text_to_speech_bytes(text, language_name)
+    if not audio:
+        raise RuntimeError("TTS produced no audio")
+    return audio
+
+
+def text_to_speech_bytes_cached(text: str, language_name: str) -> bytes | None:
+    """
+    Memoized text_to_speech_bytes.
+
+    Doctor-facing phrases recur constantly ("Take one tablet after
+    food."); a hit returns the prior MP3 bytes instead of re-running a
+    full synthesis round trip. Entries are sentence-sized MP3s, so 512
+    of them stay well under typical memory budgets. Only successful
+    syntheses land in the cache – failures come back as None here.
+    """
+    try:
+        return _tts_call_cached(text, language_name)
+    except Exception:
+        # Already logged inside text_to_speech_bytes.
+        return None
+
+
+def clear_audio_cache() -> None:
+    """Drop all memoized TTS audio (sidebar clear button)."""
+    _tts_call_cached.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _can_encode_opus() -> bool:
+    """True if pydub + an ffmpeg/avconv binary are available."""
+    try:
+        from pydub.utils import which
+    except ImportError:
+        return False
+    return bool(which("ffmpeg") or which("avconv"))
+
+
+def compress_for_web(mp3_bytes: bytes) -> tuple[bytes, str]:
+    """
+    Re-encode speech MP3 to 24 kbps Opus/WebM for playback, when possible.
+
+    gTTS emits ~128 kbps MP3; for speech content Opus at 24 kbps sounds
+    the same and is roughly 5x smaller, so the browser starts playing
+    sooner on slow links. Requires an ffmpeg binary – without one (or on
+    any encode failure) the original MP3 passes through untouched.
+
+    Returns:
+        (audio bytes, mime type for st.audio)
+    """
+    if not mp3_bytes or not _can_encode_opus():
+        return mp3_bytes, "audio/mp3"
+
+    try:
+        from pydub import AudioSegment
+
+        seg = AudioSegment.from_mp3(BytesIO(mp3_bytes))
+        buf = BytesIO()
+        seg.export(buf, format="webm", codec="libopus", bitrate="24k")
+        out = buf.getvalue()
+        if out:
+            return out, "audio/webm"
+    except Exception:
+        pass
+    return mp3_bytes, "audio/mp3"
+
+
+def text_to_speech_batch(
+    sentences: list[str], language_name: str, max_batch: int = 8
+) -> list[bytes]:
+    """
+    Synthesize several sentences concurrently, one MP3 blob per input.
+
+    At most `max_batch` requests are in flight at once (more buys nothing
+    and balloons memory on long texts). Outputs align with inputs; failed
+    sentences come back as b"". gTTS emits each blob as a self-contained
+    MP3, so callers can simply b"".join() the results into one playable
+    stream – no re-encode step needed.
+    """
+    if not sentences:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_batch, len(sentences))) as pool:
+        futures = [
+            pool.submit(text_to_speech_bytes_cached, sent, language_name)
+            for sent in sentences
+        ]
+        return [fut.result() or b"" for fut in futures]
+
+
+@lru_cache(maxsize=None)
 def _tts_code_for_language(lang_name: str) -> str:
     """
     Get a language code for gTTS based on the language name.
@@ -28,35 +169,72 @@ def _tts_code_for_language(lang_name: str) -> str:
     return code
 
 
-def text_to_speech_file(text: str, language_name: str) -> str | None:
+def text_to_speech_stream(text: str, language_name: str):
+    """
+    Yield MP3 chunks for `text` as gTTS produces them.
+
+    gTTS tokenizes long text into ~100-char requests under the hood;
+    streaming those chunks lets callers start buffering audio while the
+    later requests are still in flight, instead of waiting for the whole
+    file. Raises on backend errors – callers decide how to report them.
+    """
+    tts_lang = _tts_code_for_language(language_name)
+    yield from gTTS(text=text, lang=tts_lang).stream()
+
+
+def text_to_speech_bytes(text: str, language_name: str) -> bytes | None:
     """
-    Convert text to speech using gTTS and return path to a temp MP3 file.
+    Convert text to speech using gTTS and return MP3 bytes directly.
+
+    Accumulates the chunk stream in memory – no temp file, no reopen,
+    no cleanup. st.audio() accepts these bytes as-is.
 
     Returns:
-        str path to MP3, or None if TTS failed.
+        MP3 bytes, or None if TTS failed.
     """
     if not text or not text.strip():
         return None
 
-    tts_lang = _tts_code_for_language(language_name)
-
     try:
-        tts_obj = gTTS(text=text, lang=tts_lang)
+        buf = BytesIO()
+        for chunk in text_to_speech_stream(text, language_name):
+            buf.write(chunk)
+        audio = buf.getvalue()
 
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-        tmp_path = tmp.name
-        tmp.close()
+        if audio:
+            return audio
 
-        tts_obj.save(tmp_path)
+        logger.error("TTS error: generated audio is empty.")
+        return None
 
-        if os.path.exists(tmp_path) and os.path.getsize(tmp_path) > 0:
-            return tmp_path
+    except Exception as e:
+        logger.error("TTS error: %s", e)
+        return None
 
-        st.error("TTS error: generated audio file is empty.")
+
+def text_to_speech_file(text: str, language_name: str) -> str | None:
+    """
+    Thin path-returning wrapper over text_to_speech_bytes.
+
+    Every in-app playback path consumes bytes directly; this exists only
+    for call sites that genuinely need a file on disk (e.g. download
+    links). The caller owns the returned file and should delete it with
+    cleanup_temp_file().
+
+    Returns:
+        str path to MP3, or None if TTS failed.
+    """
+    audio = text_to_speech_bytes(text, language_name)
+    if not audio:
         return None
 
+    try:
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+        with tmp:
+            tmp.write(audio)
+        return tmp.name
     except Exception as e:
-        st.error(f"TTS error: {e}")
+        logger.error("TTS error: %s", e)
         return None
 
 
@@ -1,9 +1,15 @@
 # utils.py
 # utils.py
 
+from functools import lru_cache
+
 from config import SUPPORTED_LANGUAGES
 
 
+@lru_cache(maxsize=1)
 def get_language_list():
-    # Return all languages sorted alphabetically for nice dropdowns
-    return sorted(SUPPORTED_LANGUAGES.keys())
+    # Return all languages sorted alphabetically for nice dropdowns.
+    # The mapping is a module-level constant, so sort it once per process
+    # instead of on every Streamlit rerun; a tuple keeps the cached value
+    # immutable (and tuple() calls on it downstream are free no-ops).
+    return tuple(sorted(SUPPORTED_LANGUAGES.keys()))